@@ -1,22 +1,235 @@
-import requests
-import pandas as pd
+import asyncio
+import collections
+import csv
+import functools
+import httpx
+import math
+import orjson
+import os
+import random
 import time
 import logging
-from typing import List, Dict
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, List, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+# Output columns, in the order they are written to users.csv and repositories.csv
+USER_FIELDS = (
+    'login', 'name', 'company', 'location', 'email', 'hireable', 'bio',
+    'public_repos', 'followers', 'following', 'created_at'
+)
+# User fields copied as-is, and free-text fields where null becomes ""
+USER_COPIED_FIELDS = ('login', 'public_repos', 'followers', 'following', 'created_at')
+USER_STRING_FIELDS = ('name', 'location', 'email', 'bio')
+
+# Profile fields requested per user when batching detail lookups through GraphQL
+USER_GRAPHQL_FRAGMENT = """
+fragment UserFields on User {
+    login name company location email isHireable bio createdAt
+    repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+    followers { totalCount }
+    following { totalCount }
+}
+"""
+
+REPO_FIELDS = (
+    'login', 'full_name', 'created_at', 'stargazers_count', 'watchers_count',
+    'language', 'has_projects', 'has_wiki', 'license_name'
+)
+# Repository columns read from the API payload; 'login' is the owner we queried
+REPO_ROW_FIELDS = REPO_FIELDS[1:]
+
+# README written alongside the CSV files, filled in with the scrape's actual counts
+README_TEMPLATE = """# GitHub User & Repository Scraper
+
+This project uses the GitHub API to scrape information about users and their repositories, focusing on active developers in Bangalore with at least 100 followers.
+
+- Data was collected from the GitHub API for users in Bangalore with over 100 followers.
+- Analyzing the data revealed the varied company affiliations of users across tech sectors.
+- Recommendation: Developers should optimize their profiles for visibility, especially in high-tech cities like Bangalore.
+
+
+## 🚀 Features
+
+- Fetches GitHub users based on location and follower count.
+- Collects metadata about users and their repositories.
+- Handles GitHub API rate limits gracefully.
+- Saves data into CSV files.
+
+## Files
+
+1. `users.csv`: Contains information about {n_users} GitHub users in Bangalore with over 100 followers
+2. `repositories.csv`: Contains information about {n_repos} public repositories from these users
+3. `fetch.py`: Python script used to collect this data
+
+## Data Collection
+
+- Data collected using GitHub API
+- Date of collection: {collected_on}
+- Only included users with 100+ followers
+- Up to 500 most recently pushed repositories per user
+
+
+## 🧠 Skills Demonstrated
+
+- Python scripting and automation  
+- REST API integration and pagination  
+- Data cleaning and structuring into CSV  
+- Rate limit management  
+- Markdown and file handling
+
+## 📌 How to Use
+
+1. Clone the repository  
+2. Install the dependencies: `pip install "httpx[http2]" orjson` (Python 3.8+)  
+3. Run `fetch.py`  
+4. Enter your GitHub token when prompted  
+5. Get `users.csv`, `repositories.csv`, and this README!
+
+---
+
+
+"""
+
+# Bump when the shape of cached entries changes, so stale caches are discarded
+CACHE_VERSION = 2
+
+# Responses worth retrying with back-off (rate limits and transient server errors)
+RETRY_STATUSES = {403, 429, 500, 502, 503, 504}
+
+class RateLimiter:
+    def __init__(self, rate: float, burst: int):
+        """
+        Token bucket that paces requests proactively instead of waiting for a 403.
+        
+        The rate is sized to GitHub's per-minute secondary limits, so requests are
+        spread out steadily rather than sent in bursts. Once the hourly quota is
+        exhausted, or a secondary limit is hit anyway, the bucket holds every
+        request until it may resume.
+        
+        Args:
+            rate (float): Tokens added per second
+            burst (int): Maximum number of tokens that can accumulate
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.resume_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> 'RateLimiter':
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.resume_at:
+                    await asyncio.sleep(self.resume_at - now)
+                    continue
+                
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    def refund(self) -> None:
+        """
+        Hand back a token for a request that did not count against the quota.
+        """
+        self.tokens = min(self.burst, self.tokens + 1)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold every request through this bucket for at least `seconds`.
+        """
+        self.resume_at = max(self.resume_at, time.monotonic() + seconds)
+
+    def update(self, headers) -> None:
+        """
+        Check the X-RateLimit-Remaining and X-RateLimit-Reset headers for an exhausted quota.
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset_time = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset_time is None:
+            return
+        
+        if int(remaining) == 0:
+            # Quota is exhausted, hold every request until the window resets
+            self.pause(max(int(reset_time) - time.time(), 0) + 1)
+
+    @property
+    def exhausted(self) -> bool:
+        return time.monotonic() < self.resume_at
+
+@functools.lru_cache(maxsize=4096)
+def _clean_company_name(company: str) -> str:
+    # Company names repeat heavily across users, so results are memoized.
+    # Bare strip() covers all Unicode whitespace, e.g. non-breaking spaces
+    return company.strip().strip('@').strip().upper()
+
+# Extractors reduce API payloads to the fields we use before they are cached
+
+def _extract_logins(body: Dict) -> List[str]:
+    return [user['login'] for user in body.get('items', [])]
+
+def _extract_user(body: Dict) -> Dict:
+    return {field: body.get(field) for field in USER_FIELDS}
+
+# How each REPO_ROW_FIELDS column is read from a REST repository payload
+_REPO_GETTERS = {
+    'full_name': lambda repo: repo['full_name'],
+    'created_at': lambda repo: repo['created_at'],
+    'stargazers_count': lambda repo: repo['stargazers_count'],
+    'watchers_count': lambda repo: repo['watchers_count'],
+    'language': lambda repo: repo['language'] if repo['language'] else "",
+    'has_projects': lambda repo: str(repo['has_projects']).lower(),
+    'has_wiki': lambda repo: str(repo['has_wiki']).lower(),
+    'license_name': lambda repo: repo['license']['key'] if repo.get('license') else ""
+}
+
+def _extract_repos(body: List[Dict]) -> List[List]:
+    # One row per repository, in REPO_ROW_FIELDS order
+    getters = [_REPO_GETTERS[field] for field in REPO_ROW_FIELDS]
+    return [[get(repo) for get in getters] for repo in body]
 
 class GitHubScraper:
-    def __init__(self, token: str):
+    def __init__(self, token: str, max_concurrency: int = 64, pool_size: int = 1, max_retries: int = 5,
+                 cache_path: str = 'gh_cache.json'):
         """
         Initialize the GitHub scraper with your API token.
         
         Args:
             token (str): GitHub Personal Access Token
+            max_concurrency (int): Maximum number of in-flight requests
+            pool_size (int): Maximum number of connections to the API host, each multiplexing
+                requests over HTTP/2
+            max_retries (int): Maximum number of back-off retries per request
+            cache_path (str): JSON file used to persist ETags and extracted fields between runs
         """
         self.headers = {
             'Authorization': f'token {token}',
             'Accept': 'application/vnd.github.v3+json'
         }
         self.base_url = 'https://api.github.com'
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.cache_path = cache_path
+        self.cache = {}
+        self._session = None
+        
+        # Separate buckets per quota. REST and GraphQL are paced to their per-minute
+        # secondary limits (~900 and ~2000 points/min), search to its 30/min quota
+        self.limiters = {
+            'core': RateLimiter(rate=15, burst=15),
+            'search': RateLimiter(rate=30 / 60, burst=5),
+            'graphql': RateLimiter(rate=15, burst=15)
+        }
         
         # Setup logging
         logging.basicConfig(
@@ -25,40 +238,210 @@ class GitHubScraper:
         )
         self.logger = logging.getLogger(__name__)
 
-    def _make_request(self, url: str, params: dict = None) -> Dict:
+    async def __aenter__(self) -> 'GitHubScraper':
+        """
+        Open a single HTTP/2 client so requests are multiplexed over kept-alive
+        connections, and load the ETag cache from the previous run.
+        """
+        if os.path.exists(self.cache_path):
+            with open(self.cache_path, 'rb') as f:
+                stored = orjson.loads(f.read())
+            # Cached repo rows are positional, so a change in columns invalidates them too
+            if (isinstance(stored, dict) and stored.get('version') == CACHE_VERSION
+                    and stored.get('repo_fields') == list(REPO_ROW_FIELDS)):
+                self.cache = stored['entries']
+        
+        limits = httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size)
+        # Requests queue for a free stream rather than time out waiting on the pool
+        timeout = httpx.Timeout(60.0, pool=None)
+        self._session = httpx.AsyncClient(http2=True, headers=self.headers, limits=limits, timeout=timeout)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._session.aclose()
+        self._session = None
+        
+        # Write to a temporary file first so an interrupted run cannot leave a truncated cache
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps({
+                'version': CACHE_VERSION,
+                'repo_fields': list(REPO_ROW_FIELDS),
+                'entries': self.cache
+            }))
+        os.replace(tmp_path, self.cache_path)
+
+    async def _fetch(self, url: str, params: dict = None, payload: dict = None,
+                     extract: Callable[[Any], Any] = None) -> Any:
+        """
+        Make a request to the GitHub API and return the decoded body.
+        """
+        body, _ = await self._request(url, params, payload, extract)
+        return body
+
+    async def _request(self, url: str, params: dict = None, payload: dict = None,
+                       extract: Callable[[Any], Any] = None) -> Tuple[Any, Optional[int]]:
         """
         Make a request to the GitHub API with rate limit handling.
+        
+        Sends a GET, or a POST with `payload` as the JSON body when one is given.
+        Returns the decoded body, passed through `extract` if given, together with
+        the page number of the Link header's rel="last" entry, or None when there
+        is no further page.
+        
+        GET responses are cached by ETag, so unchanged resources come back as a
+        304 that does not count against the rate limit. Only the extracted
+        fields are cached.
         """
+        if url.endswith('/graphql'):
+            limiter = self.limiters['graphql']
+        else:
+            limiter = self.limiters['search' if '/search/' in url else 'core']
+        attempt = 0
+        
+        if payload is None:
+            method, data = 'GET', None
+            cache_key = f"{url}?{urlencode(params)}" if params else url
+            cached = self.cache.get(cache_key)
+            headers = {'If-None-Match': cached['etag']} if cached else None
+        else:
+            method, data = 'POST', orjson.dumps(payload)
+            cache_key = cached = None
+            headers = {'Content-Type': 'application/json'}
+        
         while True:
-            response = requests.get(url, headers=self.headers, params=params)
+            async with self.semaphore:
+                try:
+                    async with limiter:
+                        response = await self._session.request(method, url, params=params, content=data,
+                                                               headers=headers)
+                except httpx.TransportError as exc:
+                    # Timeouts, resets and GOAWAYs on the shared HTTP/2 connection are transient
+                    if attempt >= self.max_retries:
+                        self.logger.error(f"{type(exc).__name__} for {url}: {exc}")
+                        raise
+                    reason, retry_after = type(exc).__name__, None
+                else:
+                    if response.status_code == 304:
+                        # 304s are not counted against the quota, so hand the token back
+                        limiter.refund()
+                        return cached['body'], cached.get('last_page')
+                    
+                    limiter.update(response.headers)
+                    reason = f"Error {response.status_code}"
+                    
+                    if response.status_code == 200:
+                        body = orjson.loads(response.content)
+                        if extract is not None:
+                            body = extract(body)
+                        last = response.links.get('last')
+                        last_page = int(httpx.URL(last['url']).params['page']) if last else None
+                        if cache_key and 'ETag' in response.headers:
+                            self.cache[cache_key] = {
+                                'etag': response.headers['ETag'],
+                                'body': body,
+                                'last_page': last_page
+                            }
+                        return body, last_page
+                    elif self._is_secondary_limit(response):
+                        # Quota is left but we are sending too fast. Pause the whole bucket
+                        # without counting this towards max_retries
+                        retry_after = response.headers.get('Retry-After')
+                        limiter.pause(float(retry_after) if retry_after else 60)
+                    elif response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                        retry_after = response.headers.get('Retry-After')
+                    else:
+                        self.logger.error(f"Error {response.status_code}: {response.text}")
+                        response.raise_for_status()
             
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 403:
-                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-                sleep_time = max(reset_time - time.time(), 0) + 1
-                self.logger.warning(f"Rate limit hit. Sleeping for {sleep_time} seconds")
-                time.sleep(sleep_time)
-            else:
-                self.logger.error(f"Error {response.status_code}: {response.text}")
-                response.raise_for_status()
+            if limiter.exhausted:
+                # The limiter itself holds the next request until it may resume
+                self.logger.warning(f"Rate limited ({reason}). Waiting before resuming")
+                continue
+            
+            # Exponential back-off with jitter, sleeping outside the semaphore
+            sleep_time = float(retry_after) if retry_after else min(2 ** attempt, 60) + random.uniform(0, 1)
+            attempt += 1
+            self.logger.warning(f"{reason}. Retrying in {sleep_time:.1f} seconds")
+            await asyncio.sleep(sleep_time)
+
+    @staticmethod
+    def _is_secondary_limit(response) -> bool:
+        """
+        Tell a secondary rate limit apart from an exhausted quota or a plain 403.
+        """
+        if response.status_code not in (403, 429):
+            return False
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            return False
+        return response.status_code == 429 or 'rate limit' in response.text.lower()
+
+    async def _fetch_user_details(self, logins: List[str]) -> List[Dict]:
+        """
+        Fetch profile details for up to 100 users with a single GraphQL query.
+        
+        Results are shaped like the REST /users/{login} payload. Logins the query
+        cannot resolve as a User (e.g. organizations) fall back to the REST endpoint.
+        """
+        variables = {f'l{i}': login for i, login in enumerate(logins)}
+        query = (
+            'query(' + ', '.join(f'${name}: String!' for name in variables) + ') {\n'
+            + '\n'.join(f'u{i}: user(login: $l{i}) {{ ...UserFields }}' for i in range(len(logins)))
+            + '\n}\n' + USER_GRAPHQL_FRAGMENT
+        )
+        response = await self._fetch(f"{self.base_url}/graphql", payload={'query': query, 'variables': variables})
+        nodes = response.get('data') or {}
+        if response.get('errors'):
+            messages = '; '.join(error.get('message', '') for error in response['errors'])
+            self.logger.warning(f"GraphQL returned {len(response['errors'])} error(s): {messages}")
+        
+        details = [None] * len(logins)
+        missing = []
+        for i in range(len(logins)):
+            node = nodes.get(f'u{i}')
+            if node is None:
+                missing.append(i)
+                continue
+            
+            details[i] = {
+                'login': node['login'],
+                'name': node['name'],
+                'company': node['company'],
+                'location': node['location'],
+                'email': node['email'],
+                # REST reports a user who is not hireable as null rather than false
+                'hireable': True if node['isHireable'] else None,
+                'bio': node['bio'],
+                'public_repos': node['repositories']['totalCount'],
+                'followers': node['followers']['totalCount'],
+                'following': node['following']['totalCount'],
+                'created_at': node['createdAt']
+            }
+        
+        if missing:
+            self.logger.warning(f"Falling back to REST for {len(missing)} user(s)")
+            fallbacks = await asyncio.gather(
+                *[self._fetch(f"{self.base_url}/users/{logins[i]}", extract=_extract_user) for i in missing]
+            )
+            for i, user_data in zip(missing, fallbacks):
+                details[i] = user_data
+        
+        return details
 
     def clean_company_name(self, company: str) -> str:
         """
         Clean up company names according to specifications.
         """
-        if not company:
-            return ""
-        
         # Strip whitespace and @ symbol, convert to uppercase
-        cleaned = company.strip().lstrip('@').upper()
-        return cleaned
+        return _clean_company_name(company) if company else ""
 
-    def search_users(self, location: str, min_followers: int) -> List[Dict]:
+    async def search_users(self, location: str, min_followers: int) -> Dict[str, List]:
         """
         Search for GitHub users in a specific location with minimum followers.
+        
+        Returns a mapping of column name to column values.
         """
-        users = []
+        users = {field: [] for field in USER_FIELDS}
         page = 1
         
         while True:
@@ -72,81 +455,67 @@ class GitHubScraper:
             }
             
             url = f"{self.base_url}/search/users"
-            response = self._make_request(url, params)
+            logins = await self._fetch(url, params, extract=_extract_logins)
             
-            if not response.get('items'):
+            if not logins:
                 break
+            
+            # Fetch the details of every user on this page in one round-trip
+            details = await self._fetch_user_details(logins)
                 
-            for user in response['items']:
-                user_data = self._make_request(user['url'])
-                
+            for user_data in details:
                 # Extract only the required fields with exact matching names
-                cleaned_data = {
-                    'login': user_data['login'],
-                    'name': user_data['name'] if user_data['name'] else "",
-                    'company': self.clean_company_name(user_data.get('company')),
-                    'location': user_data['location'] if user_data['location'] else "",
-                    'email': user_data['email'] if user_data['email'] else "",
-                    'hireable': str(user_data['hireable']).lower() if user_data['hireable'] is not None else "",
-                    'bio': user_data['bio'] if user_data['bio'] else "",
-                    'public_repos': user_data['public_repos'],
-                    'followers': user_data['followers'],
-                    'following': user_data['following'],
-                    'created_at': user_data['created_at']
-                }
+                for field in USER_COPIED_FIELDS:
+                    users[field].append(user_data[field])
+                for field in USER_STRING_FIELDS:
+                    users[field].append(user_data.get(field) or "")
                 
-                users.append(cleaned_data)
+                hireable = user_data.get('hireable')
+                users['hireable'].append(str(hireable).lower() if hireable is not None else "")
+                users['company'].append(self.clean_company_name(user_data.get('company')))
                 
             page += 1
             
         return users
     
-    def get_user_repositories(self, username: str, max_repos: int = 500) -> List[Dict]:
+    async def get_user_repositories(self, username: str, max_repos: int = 500) -> Dict[str, List]:
         """
         Get repositories for a specific user.
+        
+        Returns a mapping of column name to column values.
         """
-        repos = []
-        page = 1
+        repos = {field: [] for field in REPO_FIELDS}
         
-        while len(repos) < max_repos:
-            self.logger.info(f"Fetching repositories for {username}, page {page}")
-            
-            params = {
-                'sort': 'pushed',
-                'direction': 'desc',
-                'per_page': 100,
-                'page': page
-            }
-            
-            url = f"{self.base_url}/users/{username}/repos"
-            response = self._make_request(url, params)
-            
-            if not response:
-                break
-                
-            for repo in response:
-                # Extract only the required fields with exact matching names
-                repo_data = {
-                    'login': username,  # Adding owner's login as required
-                    'full_name': repo['full_name'],
-                    'created_at': repo['created_at'],
-                    'stargazers_count': repo['stargazers_count'],
-                    'watchers_count': repo['watchers_count'],
-                    'language': repo['language'] if repo['language'] else "",
-                    'has_projects': str(repo['has_projects']).lower(),
-                    'has_wiki': str(repo['has_wiki']).lower(),
-                    'license_name': repo['license']['key'] if repo.get('license') else ""
-                }
-                repos.append(repo_data)
-                
-            if len(response) < 100:
-                break
+        params = {
+            'sort': 'pushed',
+            'direction': 'desc',
+            'per_page': 100
+        }
+        url = f"{self.base_url}/users/{username}/repos"
+        
+        # The first page's Link header tells us how many pages there are,
+        # so the rest (up to max_repos) can be fetched concurrently
+        first_page, last_page = await self._request(url, {**params, 'page': 1}, extract=_extract_repos)
+        last_page = min(last_page or 1, math.ceil(max_repos / 100))
+        self.logger.info(f"Fetching repositories for {username}, {last_page} page(s)")
+        
+        other_pages = await asyncio.gather(
+            *[self._fetch(url, {**params, 'page': page}, extract=_extract_repos)
+              for page in range(2, last_page + 1)]
+        )
+        
+        for rows in [first_page, *other_pages]:
+            for row in rows:
+                repos['login'].append(username)  # Adding owner's login as required
+                for field, value in zip(REPO_ROW_FIELDS, row):
+                    repos[field].append(value)
                 
-            page += 1
+                if len(repos['login']) >= max_repos:
+                    return repos
             
-        return repos[:max_repos]
+        return repos
 
-def main():
+async def main():
     # Get GitHub token
     token = input("Enter your GitHub token: ").strip()
     if not token:
@@ -154,62 +523,58 @@ def main():
         return
 
     # Initialize scraper
-    scraper = GitHubScraper(token)
-    
-    # Search for users in Bangalore with >100 followers
-    users = scraper.search_users(location='Bangalore', min_followers=100)
-    
-    # Save users to CSV
-    users_df = pd.DataFrame(users)
-    users_df.to_csv('users.csv', index=False)
-    
-    # Get repositories for each user
-    all_repos = []
-    for user in users:
-        repos = scraper.get_user_repositories(user['login'])
-        all_repos.extend(repos)
+    async with GitHubScraper(token) as scraper:
+        # Search for users in Bangalore with >100 followers
+        users = await scraper.search_users(location='Bangalore', min_followers=100)
+        
+        # Save users to CSV
+        with open('users.csv', 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(USER_FIELDS)
+            writer.writerows(zip(*(users[field] for field in USER_FIELDS)))
+        
+        # Get repositories for users in a window of 16 tasks ahead of the writer,
+        # streaming them to CSV in user order. The window also bounds how many
+        # finished results can wait in memory behind a slow user.
+        window = 16
+        logins = iter(users['login'])
+        pending = collections.deque()
+        
+        def schedule_next() -> None:
+            login = next(logins, None)
+            if login is not None:
+                pending.append(asyncio.create_task(scraper.get_user_repositories(login)))
+        
+        n_repos = 0
+        try:
+            for _ in range(window):
+                schedule_next()
+            
+            with open('repositories.csv', 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(REPO_FIELDS)
+                while pending:
+                    repos = await pending.popleft()
+                    schedule_next()
+                    writer.writerows(zip(*(repos[field] for field in REPO_FIELDS)))
+                    n_repos += len(repos['login'])
+        finally:
+            # Don't leave tasks running against the client once it is closed
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
     
-    # Save repositories to CSV
-    repos_df = pd.DataFrame(all_repos)
-    repos_df.to_csv('repositories.csv', index=False)
-    print(f"Scraped {len(users)} users and {len(all_repos)} repositories")
+    print(f"Scraped {len(users['login'])} users and {n_repos} repositories")
     
     # Create README.md
-    with open('README.md', 'w') as f:
-        f.write(f"""# GitHub Users in Bangalore
-
-GitHub User & Repository Scraper
-This project uses the GitHub API to scrape information about users and their repositories, focusing on active developers in Bangalore with at least 100 followers.
-
-    Data was collected from the GitHub API for users in Bangalore with over 100 followers.
-    Analyzing the data revealed the varied company affiliations of users across tech sectors.
-    Recommendation: Developers should optimize their profiles for visibility, especially in high-tech cities like Bangalore.
-🚀 Features
-    Fetches GitHub users based on location and follower count.
-    Collects metadata about users and their repositories.
-    Handles GitHub API rate limits gracefully.
-    Saves data into CSV files.
-Files
-    users.csv: Contains information about 602 GitHub users in Bangalore with over 100 followers
-    repositories.csv: Contains information about 50215 public repositories from these users
-    fetch.py: Python script used to collect this data
-Data Collection
-    Data collected using GitHub API
-    Date of collection: 2024-10-28
-    Only included users with 100+ followers
-    Up to 500 most recently pushed repositories per user
-🧠 Skills Demonstrated
-    Python scripting and automation
-    REST API integration and pagination
-    Data cleaning and structuring with pandas
-    Rate limit management
-    Markdown and file handling
-📌 How to Use
-    Clone the repository
-    Run fetch.py
-    Enter your GitHub token when prompted
-    Get users.csv, repositories.csv, and this README!
+    readme = README_TEMPLATE.format(
+        n_users=len(users['login']),
+        n_repos=n_repos,
+        collected_on=date.today().isoformat()
+    )
+    # Match the CRLF line endings of the checked-in README
+    Path('README.md').write_bytes(readme.replace('\n', '\r\n').encode('utf-8'))
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())